@@ -6,20 +6,54 @@ Extracts book data and saves to CSV and SQLite formats.
 """
 
 import argparse
+import array
+import asyncio
 import csv
 import logging
+import multiprocessing
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import astuple, dataclass
+from operator import attrgetter
 from pathlib import Path
 from typing import List, Optional
-from urllib.parse import urljoin, urlparse
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+try:
+    import requests_cache
+except ImportError:  # caching is optional; fall back to a plain session
+    requests_cache = None
 
-@dataclass
+# CSV/SQLite column order; attrgetter extracts all fields in one C call
+_FIELDS = ('title', 'price', 'rating', 'availability', 'product_url', 'upc', 'category', 'description')
+_GET_ROW = attrgetter(*_FIELDS)
+
+# Rating word -> numeric value ("star-rating Three" etc.)
+_RATING_MAP = {
+    'One': 1, 'Two': 2, 'Three': 3, 'Four': 4, 'Five': 5
+}
+
+# XPath selectors compiled once at import time and reused for every page
+_LISTING_XPATH = etree.XPath("//article[@class='product_pod']")
+_TITLE_XPATH = etree.XPath(".//h3/a/@title")
+_HREF_XPATH = etree.XPath(".//h3/a/@href")
+_PRICE_XPATH = etree.XPath(".//p[@class='price_color']/text()")
+_RATING_XPATH = etree.XPath(".//p[contains(@class,'star-rating')]/@class")
+_AVAIL_XPATH = etree.XPath("string(.//p[contains(@class,'availability')])")
+_UPC_XPATH = etree.XPath("//th[.='UPC']/following-sibling::td[1]/text()")
+_CAT_XPATH = etree.XPath("//ul[@class='breadcrumb']/li/a/text()")
+_DESC_XPATH = etree.XPath("//div[@id='product_description']/following-sibling::p[1]/text()")
+
+
+@dataclass(slots=True)
 class BookRow:
     """Data class for book information."""
     title: str
@@ -27,9 +61,177 @@ class BookRow:
     rating: int
     availability: str
     product_url: str
-    upc: Optional[str] = None
-    category: Optional[str] = None
-    description: Optional[str] = None
+    upc: str = ''
+    category: str = ''
+    description: str = ''
+
+
+class BookStore:
+    """Columnar (structure-of-arrays) storage for scraped books.
+
+    String fields live in plain lists and ratings in a packed byte
+    array, which is much smaller than one object per book on large
+    crawls; rows are materialized back into BookRow only on demand.
+    """
+
+    __slots__ = ('titles', 'prices', 'ratings', 'availability',
+                 'product_urls', 'upcs', 'categories', 'descriptions')
+
+    def __init__(self):
+        self.titles: List[str] = []
+        self.prices: List[str] = []
+        self.ratings = array.array('B')
+        self.availability: List[str] = []
+        self.product_urls: List[str] = []
+        self.upcs: List[str] = []
+        self.categories: List[str] = []
+        self.descriptions: List[str] = []
+
+    def extend(self, books: List[BookRow]):
+        """Append a batch of BookRow records column-wise."""
+        for book in books:
+            self.titles.append(book.title)
+            self.prices.append(book.price)
+            self.ratings.append(book.rating)
+            self.availability.append(book.availability)
+            self.product_urls.append(book.product_url)
+            self.upcs.append(book.upc)
+            self.categories.append(book.category)
+            self.descriptions.append(book.description)
+
+    def rows(self):
+        """Iterate raw field tuples in CSV/SQLite column order (one C-level zip walk)."""
+        return zip(self.titles, self.prices, self.ratings, self.availability,
+                   self.product_urls, self.upcs, self.categories, self.descriptions)
+
+    def _row(self, index: int) -> BookRow:
+        return BookRow(self.titles[index], self.prices[index], self.ratings[index],
+                       self.availability[index], self.product_urls[index],
+                       self.upcs[index], self.categories[index], self.descriptions[index])
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def __iter__(self):
+        return map(self._row, range(len(self.titles)))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._row(i) for i in range(*index.indices(len(self.titles)))]
+        return self._row(index)
+
+
+def _extract_rating(rating_class: str) -> int:
+    """Convert rating class ("star-rating Three") to numeric value."""
+    return _RATING_MAP.get(rating_class.rpartition(' ')[2], 0)
+
+
+def _extract_availability(availability_text: str) -> str:
+    """Extract quantity from text like "In stock (22 available)"."""
+    _, _, rest = availability_text.partition('(')
+    num, _, _ = rest.partition(' ')
+    if num.isdigit():
+        return num
+    return "Unknown" if 'In stock' in availability_text else "0"
+
+
+def _join_product_url(base_url: str, href: str) -> str:
+    """Cheap urljoin for the site's fixed href shapes.
+
+    Listing hrefs are either relative to the catalogue ("x_1000/index.html",
+    possibly behind "../" hops) or prefixed with "catalogue/"; full URL
+    parsing and path normalization would be wasted work here.
+    """
+    while href.startswith('../'):
+        href = href[3:]
+    return base_url + href.removeprefix('catalogue/')
+
+
+def _parse_article(article: lxml_html.HtmlElement, base_url: str) -> Optional[BookRow]:
+    """Parse one product_pod article, or None if its markup is malformed."""
+    try:
+        # Title and URL
+        titles = _TITLE_XPATH(article)
+        hrefs = _HREF_XPATH(article)
+
+        # Price
+        prices = _PRICE_XPATH(article)
+
+        # Rating
+        rating_classes = _RATING_XPATH(article)
+
+        return BookRow(
+            title=titles[0].strip() if titles else "",
+            price=prices[0].strip() if prices else "N/A",
+            rating=_extract_rating(rating_classes[0] if rating_classes else ""),
+            availability=_extract_availability(_AVAIL_XPATH(article).strip()),
+            product_url=_join_product_url(base_url, hrefs[0]) if hrefs else ""
+        )
+
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error parsing book: {e}")
+        return None
+
+
+def _parse_listing_tree(tree: lxml_html.HtmlElement, base_url: str) -> List[BookRow]:
+    """Extract book data from a parsed listing page."""
+    parsed = (_parse_article(article, base_url) for article in _LISTING_XPATH(tree))
+    return [book for book in parsed if book is not None]
+
+
+def parse_listing_page(content: bytes, base_url: str) -> List[BookRow]:
+    """Parse one listing page from raw HTML bytes (top-level, so picklable)."""
+    try:
+        tree = lxml_html.fromstring(content)
+    except etree.LxmlError as e:
+        logging.getLogger(__name__).error(f"Error parsing listing page: {e}")
+        return []
+    return _parse_listing_tree(tree, base_url)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter: allows short bursts, throttles at steady state."""
+
+    def __init__(self, rate: float, capacity: int = 5):
+        self.rate = rate  # tokens refilled per second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.ts = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take one token and return how long to wait before proceeding."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.ts) * self.rate)
+            self.ts = now
+            self.tokens -= 1.0
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self, stop_event: Optional[threading.Event] = None):
+        """Block until a token is available (or the stop event fires)."""
+        wait = self._reserve()
+        if wait > 0:
+            if stop_event is not None:
+                stop_event.wait(wait)  # wakes immediately on cancellation
+            else:
+                time.sleep(wait)
+
+    async def acquire_async(self, stop_event: Optional[threading.Event] = None):
+        """Async variant: yield to the event loop instead of blocking."""
+        wait = self._reserve()
+        if wait <= 0:
+            return
+        if stop_event is None:
+            await asyncio.sleep(wait)
+            return
+        # Sleep in short slices so cancellation is noticed promptly
+        deadline = time.monotonic() + wait
+        while not stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            await asyncio.sleep(min(remaining, 0.1))
 
 
 class BooksToScrapeScraper:
@@ -38,193 +240,377 @@ class BooksToScrapeScraper:
     def __init__(self, delay: float = 0.7, log_level: str = "INFO"):
         """Initialize the scraper with configuration."""
         self.delay = delay
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Re-runs serve unchanged pages from the local cache
+            self.session = requests_cache.CachedSession(
+                'books_cache',
+                backend='sqlite',
+                expire_after=3600,
+                allowable_methods=['GET'],
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
-        
+
+        # Reuse one pooled connection and retry at the transport layer
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=64,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Setup logging
         logging.basicConfig(
             level=getattr(logging, log_level.upper()),
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
         self.logger = logging.getLogger(__name__)
-        
-        # Rating mapping
-        self.rating_map = {
-            'One': 1, 'Two': 2, 'Three': 3, 'Four': 4, 'Five': 5
-        }
-    
-    def get_page(self, url: str, max_retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page with retries."""
-        for attempt in range(max_retries):
-            try:
-                self.logger.info(f"Fetching: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.content, 'lxml')
-                time.sleep(self.delay)  # Be polite
-                return soup
-                
-            except requests.RequestException as e:
-                self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    self.logger.error(f"Failed to fetch {url} after {max_retries} attempts")
-                    return None
+
+        # Polite crawl rate: 1/delay requests per second at steady state
+        self.bucket = TokenBucket(rate=1.0 / delay if delay > 0 else float('inf'))
+
+        # Set per scrape; fetch paths bail out once it fires
+        self.stop_event: Optional[threading.Event] = None
+
+    def _stopped(self) -> bool:
+        """True once the current scrape has been cancelled."""
+        return self.stop_event is not None and self.stop_event.is_set()
+
+    def _acquire(self, url: str) -> None:
+        """Rate-limit a request, unless it will be served from the cache.
+
+        Cached reruns hit the local store only, so throttling them would
+        reintroduce the full crawl delay for no politeness benefit.
+        """
+        if requests_cache is not None and self.session.cache.contains(url=url):
+            return
+        self.bucket.acquire(self.stop_event)
+
+    def get_page(self, url: str) -> Optional[lxml_html.HtmlElement]:
+        """Fetch and parse a web page; retries happen in the mounted adapter."""
+        if self._stopped():
+            return None
+        try:
+            self._acquire(url)  # Be polite (skipped for cache hits)
+            if self._stopped():  # the wait wakes early on cancellation
+                return None
+            self.logger.info(f"Fetching: {url}")
+            response = self.session.get(url, timeout=10, stream=True)
+            response.raise_for_status()
+
+            # Feed the parser as chunks arrive so parsing overlaps the download
+            parser = lxml_html.HTMLParser()
+            for chunk in response.iter_content(8192):
+                parser.feed(chunk)
+            return parser.close()
+
+        except (requests.RequestException, etree.LxmlError) as e:
+            self.logger.error(f"Failed to fetch {url}: {e}")
+            return None
     
     def extract_rating(self, rating_class: str) -> int:
-        """Convert rating class to numeric value."""
-        for word, num in self.rating_map.items():
-            if word.lower() in rating_class.lower():
-                return num
-        return 0
-    
+        """Convert rating class ("star-rating Three") to numeric value."""
+        return _extract_rating(rating_class)
+
     def extract_availability(self, availability_text: str) -> str:
-        """Extract quantity from availability text."""
-        if 'In stock' in availability_text:
-            # Extract number from text like "In stock (22 available)"
-            import re
-            match = re.search(r'\((\d+) available\)', availability_text)
-            return match.group(1) if match else "Unknown"
-        return "0"
+        """Extract quantity from text like "In stock (22 available)"."""
+        return _extract_availability(availability_text)
     
-    def scrape_book_listing(self, soup: BeautifulSoup, base_url: str) -> List[BookRow]:
+    def scrape_book_listing(self, tree: lxml_html.HtmlElement, base_url: str) -> List[BookRow]:
         """Extract book data from a listing page."""
-        books = []
-        articles = soup.find_all('article', class_='product_pod')
-        
-        for article in articles:
-            try:
-                # Title and URL
-                title_link = article.find('h3').find('a')
-                title = title_link.get('title', '').strip()
-                relative_url = title_link.get('href', '')
-                product_url = urljoin(base_url, relative_url)
-                
-                # Price
-                price_element = article.find('p', class_='price_color')
-                price = price_element.text.strip() if price_element else "N/A"
-                
-                # Rating
-                rating_element = article.find('p', class_='star-rating')
-                rating_class = rating_element.get('class', []) if rating_element else []
-                rating = self.extract_rating(' '.join(rating_class))
-                
-                # Availability
-                availability_element = article.find('p', class_='instock availability')
-                availability_text = availability_element.text.strip() if availability_element else ""
-                availability = self.extract_availability(availability_text)
-                
-                books.append(BookRow(
-                    title=title,
-                    price=price,
-                    rating=rating,
-                    availability=availability,
-                    product_url=product_url
-                ))
-                
-            except Exception as e:
-                self.logger.warning(f"Error parsing book: {e}")
-                continue
-        
-        return books
+        return _parse_listing_tree(tree, base_url)
+
+    def get_page_content(self, url: str) -> Optional[bytes]:
+        """Fetch a page and return raw bytes (for out-of-process parsing)."""
+        if self._stopped():
+            return None
+        try:
+            self._acquire(url)  # Be polite (skipped for cache hits)
+            if self._stopped():  # the wait wakes early on cancellation
+                return None
+            self.logger.info(f"Fetching: {url}")
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+            return response.content
+
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch {url}: {e}")
+            return None
     
     def scrape_book_detail(self, book: BookRow) -> BookRow:
-        """Fetch additional details from product page."""
-        soup = self.get_page(book.product_url)
-        if not soup:
+        """Fetch additional details from product page.
+
+        The page is pull-parsed as it streams in and the connection is
+        closed as soon as UPC, category and description have all been
+        seen, skipping the rest of the download and parse.
+        """
+        if self._stopped():
             return book
-        
+        try:
+            self._acquire(book.product_url)  # Be polite (skipped for cache hits)
+            if self._stopped():  # the wait wakes early on cancellation
+                return book
+            self.logger.info(f"Fetching: {book.product_url}")
+            response = self.session.get(book.product_url, timeout=10, stream=True)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.logger.error(f"Failed to fetch {book.product_url}: {e}")
+            return book
+
+        got_upc = got_category = got_description = False
+        parser = etree.HTMLPullParser(events=('end',))
+
+        try:
+            for chunk in response.iter_content(8192):
+                parser.feed(chunk)
+                for _, elem in parser.read_events():
+                    tag = elem.tag
+                    if not got_upc and tag == 'td':
+                        prev = elem.getprevious()
+                        if prev is not None and prev.tag == 'th' and prev.text == 'UPC':
+                            book.upc = (elem.text or '').strip()
+                            got_upc = True
+                    elif not got_category and tag == 'ul' and elem.get('class') == 'breadcrumb':
+                        # Last breadcrumb link: Home / Books / <category>
+                        links = elem.findall('.//a')
+                        if links:
+                            book.category = (links[-1].text or '').strip()
+                        got_category = True
+                    elif not got_description and tag == 'p':
+                        prev = elem.getprevious()
+                        if prev is not None and prev.tag == 'div' and prev.get('id') == 'product_description':
+                            book.description = (elem.text or '').strip()
+                            got_description = True
+
+                if got_upc and got_category and got_description:
+                    break  # everything found; don't download the footer
+
+        except Exception as e:
+            self.logger.warning(f"Error fetching details for {book.title}: {e}")
+        finally:
+            response.close()
+
+        return book
+
+    def parse_book_detail(self, tree: lxml_html.HtmlElement, book: BookRow) -> BookRow:
+        """Extract UPC, category and description from a parsed product page."""
         try:
             # UPC
-            upc_element = soup.find('th', string='UPC')
-            upc = upc_element.find_next_sibling('td').text.strip() if upc_element else None
-            
-            # Category
-            category_element = soup.find('ul', class_='breadcrumb').find_all('a')[-1]
-            category = category_element.text.strip() if category_element else None
-            
+            upcs = _UPC_XPATH(tree)
+            book.upc = upcs[0].strip() if upcs else ''
+
+            # Category (last breadcrumb link: Home / Books / <category>)
+            categories = _CAT_XPATH(tree)
+            book.category = categories[-1].strip() if categories else ''
+
             # Description
-            desc_element = soup.find('div', id='product_description')
-            if desc_element:
-                description = desc_element.find_next_sibling('p').text.strip()
-            else:
-                description = None
-            
-            # Update book with additional details
-            book.upc = upc
-            book.category = category
-            book.description = description
-            
+            descriptions = _DESC_XPATH(tree)
+            book.description = descriptions[0].strip() if descriptions else ''
+
         except Exception as e:
             self.logger.warning(f"Error fetching details for {book.title}: {e}")
-        
+
         return book
     
-    def scrape_books(self, max_pages: int = 3, deep: bool = False) -> List[BookRow]:
-        """Main scraping method."""
-        all_books = []
+    def scrape_books(self, max_pages: int = 3, deep: bool = False,
+                     concurrency: int = 20,
+                     parse_processes: Optional[int] = None,
+                     stop_event: Optional[threading.Event] = None) -> BookStore:
+        """Main scraping method: overlapping listing and detail fetches.
+
+        With parse_processes set, listing pages are parsed across a
+        multiprocessing.Pool instead of on the downloading threads. A
+        stop_event cancels the crawl promptly, even mid rate-limit wait.
+        """
+        self.stop_event = stop_event
         base_url = "https://books.toscrape.com/catalogue/"
-        
-        for page_num in range(1, max_pages + 1):
-            self.logger.info(f"Crawling page {page_num}...")
-            url = f"{base_url}page-{page_num}.html"
-            
-            soup = self.get_page(url)
-            if not soup:
+        books_by_page = {}
+        detail_futures = []
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            if parse_processes and parse_processes > 1:
+                books_by_page = self._scrape_listings_multiprocess(
+                    executor, base_url, max_pages, parse_processes)
+                if deep:
+                    detail_futures.extend(
+                        executor.submit(self.scrape_book_detail, book)
+                        for books in books_by_page.values() for book in books
+                    )
+            else:
+                # Submit all listing fetches up front; parse each as it completes
+                listing_futures = {
+                    executor.submit(self.get_page, f"{base_url}page-{page_num}.html"): page_num
+                    for page_num in range(1, max_pages + 1)
+                }
+
+                for future in as_completed(listing_futures):
+                    page_num = listing_futures[future]
+                    tree = future.result()
+                    if tree is None:
+                        if not self._stopped():
+                            self.logger.error(f"Failed to fetch page {page_num}")
+                        continue
+
+                    books = self.scrape_book_listing(tree, base_url)
+                    self.logger.info(f"Found {len(books)} books on page {page_num}")
+                    books_by_page[page_num] = books
+
+                    # Detail fetches start while later listing pages are still in flight
+                    if deep:
+                        detail_futures.extend(
+                            executor.submit(self.scrape_book_detail, book) for book in books
+                        )
+
+            if detail_futures:
+                self.logger.info(f"Fetching detailed information for {len(detail_futures)} books...")
+                for future in as_completed(detail_futures):
+                    future.result()  # details are filled into the BookRow in place
+
+        # Assemble columnar, in page order so output stays deterministic
+        store = BookStore()
+        for page_num in sorted(books_by_page):
+            store.extend(books_by_page[page_num])
+
+        self.logger.info(f"Total books scraped: {len(store)}")
+        return store
+
+    def _scrape_listings_multiprocess(self, executor: ThreadPoolExecutor, base_url: str,
+                                      max_pages: int, processes: int) -> dict:
+        """Download listing bytes on threads, then parse them across cores."""
+        content_futures = {
+            executor.submit(self.get_page_content, f"{base_url}page-{page_num}.html"): page_num
+            for page_num in range(1, max_pages + 1)
+        }
+
+        contents = {}
+        for future in as_completed(content_futures):
+            page_num = content_futures[future]
+            content = future.result()
+            if content is None:
                 self.logger.error(f"Failed to fetch page {page_num}")
                 continue
-            
-            books = self.scrape_book_listing(soup, base_url)
-            self.logger.info(f"Found {len(books)} books on page {page_num}")
-            
-            # Fetch detailed information if requested
-            if deep:
+            contents[page_num] = content
+
+        page_nums = sorted(contents)
+        with multiprocessing.Pool(processes=processes) as pool:
+            parsed = pool.starmap(
+                parse_listing_page,
+                [(contents[page_num], base_url) for page_num in page_nums]
+            )
+
+        books_by_page = dict(zip(page_nums, parsed))
+        for page_num in page_nums:
+            self.logger.info(f"Found {len(books_by_page[page_num])} books on page {page_num}")
+        return books_by_page
+
+    async def _fetch(self, session: aiohttp.ClientSession, url: str,
+                     semaphore: asyncio.Semaphore,
+                     max_retries: int = 3) -> Optional[lxml_html.HtmlElement]:
+        """Fetch and parse a web page asynchronously with retries."""
+        async with semaphore:
+            for attempt in range(max_retries):
+                if self._stopped():
+                    return None
+                try:
+                    await self.bucket.acquire_async(self.stop_event)  # Be polite
+                    if self._stopped():
+                        return None
+                    self.logger.info(f"Fetching: {url} (attempt {attempt + 1})")
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        content = await response.read()
+
+                    return lxml_html.fromstring(content)
+
+                except (aiohttp.ClientError, asyncio.TimeoutError, etree.LxmlError) as e:
+                    self.logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    else:
+                        self.logger.error(f"Failed to fetch {url} after {max_retries} attempts")
+                        return None
+
+    async def scrape_books_async(self, max_pages: int = 3, deep: bool = False,
+                                 concurrency: int = 20,
+                                 stop_event: Optional[threading.Event] = None) -> BookStore:
+        """Async scraping method: overlaps page fetches instead of one-at-a-time."""
+        self.stop_event = stop_event
+        all_books = []
+        base_url = "https://books.toscrape.com/catalogue/"
+        semaphore = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=10)
+
+        async with aiohttp.ClientSession(timeout=timeout,
+                                         headers=dict(self.session.headers)) as session:
+            # Fetch all listing pages concurrently
+            trees = await asyncio.gather(*[
+                self._fetch(session, f"{base_url}page-{page_num}.html", semaphore)
+                for page_num in range(1, max_pages + 1)
+            ])
+
+            for page_num, tree in enumerate(trees, start=1):
+                if tree is None:
+                    if not self._stopped():
+                        self.logger.error(f"Failed to fetch page {page_num}")
+                    continue
+
+                books = self.scrape_book_listing(tree, base_url)
+                self.logger.info(f"Found {len(books)} books on page {page_num}")
+                all_books.extend(books)
+
+            # Fetch all detail pages in one concurrent batch if requested
+            if deep and all_books:
                 self.logger.info("Fetching detailed information...")
-                for i, book in enumerate(books):
-                    self.logger.info(f"Fetching details for book {i+1}/{len(books)}: {book.title}")
-                    books[i] = self.scrape_book_detail(book)
-            
-            all_books.extend(books)
-        
-        self.logger.info(f"Total books scraped: {len(all_books)}")
-        return all_books
-    
-    def save_to_csv(self, books: List[BookRow], filename: str):
-        """Save books data to CSV file."""
+                detail_trees = await asyncio.gather(*[
+                    self._fetch(session, book.product_url, semaphore)
+                    for book in all_books
+                ])
+                for book, detail_tree in zip(all_books, detail_trees):
+                    if detail_tree is not None:
+                        self.parse_book_detail(detail_tree, book)
+
+        store = BookStore()
+        store.extend(all_books)
+        self.logger.info(f"Total books scraped: {len(store)}")
+        return store
+
+    def save_to_csv(self, books, filename: str):
+        """Save books data (BookStore or list of BookRow) to CSV file."""
         self.logger.info(f"Saving {len(books)} books to {filename}")
-        
+
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['title', 'price', 'rating', 'availability', 'product_url', 'upc', 'category', 'description']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            writer.writeheader()
-            for book in books:
-                writer.writerow({
-                    'title': book.title,
-                    'price': book.price,
-                    'rating': book.rating,
-                    'availability': book.availability,
-                    'product_url': book.product_url,
-                    'upc': book.upc or '',
-                    'category': book.category or '',
-                    'description': book.description or ''
-                })
-        
+            writer = csv.writer(csvfile)
+            writer.writerow(_FIELDS)
+            if isinstance(books, BookStore):
+                writer.writerows(books.rows())  # straight column zip, no row objects
+            else:
+                writer.writerows(map(_GET_ROW, books))
+
         self.logger.info(f"CSV saved successfully: {filename}")
     
-    def save_to_sqlite(self, books: List[BookRow], filename: str):
-        """Save books data to SQLite database."""
+    def save_to_sqlite(self, books, filename: str):
+        """Save books data (BookStore or list of BookRow) to SQLite database."""
         self.logger.info(f"Saving {len(books)} books to SQLite: {filename}")
         
         conn = sqlite3.connect(filename)
-        cursor = conn.cursor()
-        
+
+        # Fewer fsyncs: WAL journal, relaxed sync, in-memory temp tables
+        conn.executescript(
+            'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;'
+        )
+
         # Create table
-        cursor.execute('''
+        conn.execute('''
             CREATE TABLE IF NOT EXISTS books (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 title TEXT NOT NULL,
@@ -237,18 +623,15 @@ class BooksToScrapeScraper:
                 description TEXT
             )
         ''')
-        
-        # Insert data
-        for book in books:
-            cursor.execute('''
+
+        # Insert all rows in a single transaction
+        with conn:
+            conn.executemany('''
                 INSERT INTO books (title, price, rating, availability, product_url, upc, category, description)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                book.title, book.price, book.rating, book.availability,
-                book.product_url, book.upc, book.category, book.description
-            ))
-        
-        conn.commit()
+            ''', books.rows() if isinstance(books, BookStore)
+                else (astuple(book) for book in books))
+
         conn.close()
         self.logger.info(f"SQLite database saved successfully: {filename}")
 
@@ -7,8 +7,12 @@ Features pastel colors and intuitive controls.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import asyncio
 import threading
+import queue
+import types
 import os
+import subprocess
 import sys
 from pathlib import Path
 import webbrowser
@@ -16,10 +20,72 @@ import webbrowser
 # Import our scraper
 from scrape_books import BooksToScrapeScraper, print_sample_data
 
+def _open_path(path):
+    """Open a file or folder with the platform's default handler, no shell."""
+    if sys.platform == "win32":
+        os.startfile(path)
+    else:
+        opener = "open" if sys.platform == "darwin" else "xdg-open"
+        subprocess.Popen([opener, path])
+
+
+def _is_int_field(proposed):
+    """Tk key validator: accept only digits (empty allowed while editing)."""
+    return proposed.isdigit() or proposed == ''
+
+
+def _is_float_field(proposed):
+    """Tk key validator: accept a decimal number (empty allowed while editing)."""
+    if proposed in ('', '.'):
+        return True
+    try:
+        float(proposed)
+    except ValueError:
+        return False
+    return True
+
+
+# Integer log levels, matching stdlib logging; SUCCESS ranks above ERROR
+# so completion feedback is never filtered out by a quiet log level
+_LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "SUCCESS": 50}
+
+# Tk Text widgets degrade badly past ~10k lines; keep the log bounded
+_MAX_LOG_LINES = 5000
+
+
+class _GuiLogger:
+    """Minimal logger that forwards scraper messages to the GUI log queue.
+
+    Dispatch is one integer compare plus a queue.put; messages below the
+    configured level are dropped before any formatting happens.
+    """
+
+    __slots__ = ('q', 'level')
+
+    def __init__(self, q, level=20):
+        self.q = q
+        self.level = level
+
+    def debug(self, message):
+        if self.level <= 10:
+            self.q.put(("DEBUG", f"DEBUG: {message}"))
+
+    def info(self, message):
+        if self.level <= 20:
+            self.q.put(("INFO", f"INFO: {message}"))
+
+    def warning(self, message):
+        if self.level <= 30:
+            self.q.put(("WARNING", f"WARNING: {message}"))
+
+    def error(self, message):
+        if self.level <= 40:
+            self.q.put(("ERROR", f"ERROR: {message}"))
+
 
 class ScraperGUI:
     """Main GUI class for the web scraper."""
-    
+
     def __init__(self, root):
         self.root = root
         self.setup_window()
@@ -27,7 +93,26 @@ class ScraperGUI:
         self.create_widgets()
         self.scraper = None
         self.is_running = False
-        
+        self._stop_event = threading.Event()
+
+        # Worker threads queue log lines; the main loop drains them in batches
+        self._log_queue = queue.Queue()
+        self._gui_logger = _GuiLogger(self._log_queue)
+        self._min_level = _LOG_LEVELS["INFO"]
+
+        # Latest pending progress/status; coalesced to one Tk set per tick
+        self._ui_lock = threading.Lock()
+        self._progress = None
+        self._pending_progress = 0.0
+        self._status = None
+
+        self.root.after(50, self._drain_log)
+
+        # One persistent event loop on a background thread runs all scrapes:
+        # N concurrent sockets on a single worker instead of blocking calls
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
     def setup_window(self):
         """Configure the main window."""
         self.root.title("HexSoftwares Web Scraper")
@@ -46,7 +131,8 @@ class ScraperGUI:
         
     def setup_styles(self):
         """Setup pastel color theme and styles."""
-        self.colors = {
+        # Frozen so styles and tags can't drift apart at runtime
+        self.colors = types.MappingProxyType({
             'bg_primary': '#E6F3FF',      # Light blue
             'bg_secondary': '#D1ECF1',    # Soft blue
             'accent_1': '#B8D4F0',        # Light blue accent
@@ -60,43 +146,59 @@ class ScraperGUI:
             'success': '#28A745',         # Green
             'warning': '#FFC107',         # Yellow
             'error': '#DC3545'            # Red
-        }
-        
+        })
+
+        # Look each color up once instead of per style call
+        colors = self.colors
+        bg_primary = colors['bg_primary']
+        bg_secondary = colors['bg_secondary']
+        text_primary = colors['text_primary']
+        text_secondary = colors['text_secondary']
+        button_bg = colors['button_bg']
+        button_hover = colors['button_hover']
+
         # Configure root background
-        self.root.configure(bg=self.colors['bg_primary'])
-        
+        self.root.configure(bg=bg_primary)
+
+        # ttk styles are global to the Tcl interpreter, but each tk.Tk()
+        # root has its own interpreter, so key the configure-once guard on
+        # the root rather than on the class
+        if getattr(self.root, '_pastel_styles_done', False):
+            return
+        self.root._pastel_styles_done = True
+
         # Configure ttk styles
-        style = ttk.Style()
+        style = ttk.Style(self.root)
         style.theme_use('clam')
-        
+
         # Configure button styles
         style.configure('Pastel.TButton',
-                       background=self.colors['button_bg'],
-                       foreground=self.colors['text_primary'],
+                       background=button_bg,
+                       foreground=text_primary,
                        font=('SF Pro Display', 10, 'bold'),
                        padding=(10, 8))
-        
+
         style.map('Pastel.TButton',
-                 background=[('active', self.colors['button_hover']),
-                           ('pressed', self.colors['button_hover'])])
-        
+                 background=[('active', button_hover),
+                           ('pressed', button_hover)])
+
         # Configure frame styles
         style.configure('Card.TFrame',
-                       background=self.colors['bg_secondary'],
+                       background=bg_secondary,
                        relief='raised',
                        borderwidth=1)
-        
+
         # Configure label styles
         style.configure('Title.TLabel',
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['text_primary'],
+                       background=bg_primary,
+                       foreground=text_primary,
                        font=('SF Pro Display', 16, 'bold'))
-        
+
         style.configure('Subtitle.TLabel',
-                       background=self.colors['bg_primary'],
-                       foreground=self.colors['text_secondary'],
+                       background=bg_primary,
+                       foreground=text_secondary,
                        font=('SF Pro Display', 12))
-        
+
     def create_widgets(self):
         """Create and arrange all GUI widgets."""
         # Main container
@@ -144,48 +246,69 @@ class ScraperGUI:
         
     def create_controls_panel(self, parent):
         """Create the controls panel."""
-        controls_frame = ttk.LabelFrame(parent, text="Scraping Options", 
+        controls_frame = ttk.LabelFrame(parent, text="Scraping Options",
                                        style='Card.TFrame', padding=15)
         controls_frame.grid(row=0, column=0, sticky='nsew', padx=(0, 10))
-        
+
+        # Freeze geometry while children are gridded: one layout pass at the
+        # end instead of one per .grid() call
+        controls_frame.grid_propagate(False)
+        controls_frame.configure(width=380, height=520)
+
+        # Key-level validators: Tk filters bad characters as they are typed,
+        # so start_scraping can cast without an exception path
+        vcmd_int = (self.root.register(_is_int_field), '%P')
+        vcmd_float = (self.root.register(_is_float_field), '%P')
+
         # Max Pages
-        ttk.Label(controls_frame, text="Max Pages:", 
+        ttk.Label(controls_frame, text="Max Pages:",
                  font=('SF Pro Display', 10, 'bold')).grid(row=0, column=0, sticky='w', pady=5)
         self.max_pages_var = tk.StringVar(value="3")
-        max_pages_spinbox = ttk.Spinbox(controls_frame, from_=1, to=50, 
-                                       textvariable=self.max_pages_var, width=10)
+        max_pages_spinbox = ttk.Spinbox(controls_frame, from_=1, to=50,
+                                       textvariable=self.max_pages_var, width=10,
+                                       validate='key', validatecommand=vcmd_int)
         max_pages_spinbox.grid(row=0, column=1, sticky='w', padx=(10, 0), pady=5)
-        
+
         # Delay
-        ttk.Label(controls_frame, text="Delay (seconds):", 
+        ttk.Label(controls_frame, text="Delay (seconds):",
                  font=('SF Pro Display', 10, 'bold')).grid(row=1, column=0, sticky='w', pady=5)
         self.delay_var = tk.StringVar(value="0.7")
         delay_spinbox = ttk.Spinbox(controls_frame, from_=0.1, to=5.0, increment=0.1,
-                                   textvariable=self.delay_var, width=10)
+                                   textvariable=self.delay_var, width=10,
+                                   validate='key', validatecommand=vcmd_float)
         delay_spinbox.grid(row=1, column=1, sticky='w', padx=(10, 0), pady=5)
-        
+
+        # Concurrency (parallel page fetches)
+        ttk.Label(controls_frame, text="Concurrency:",
+                 font=('SF Pro Display', 10, 'bold')).grid(row=2, column=0, sticky='w', pady=5)
+        self.concurrency_var = tk.StringVar(value="4")
+        concurrency_spinbox = ttk.Spinbox(controls_frame, from_=1, to=20,
+                                         textvariable=self.concurrency_var, width=10,
+                                         validate='key', validatecommand=vcmd_int)
+        concurrency_spinbox.grid(row=2, column=1, sticky='w', padx=(10, 0), pady=5)
+
         # Deep Scraping
         self.deep_var = tk.BooleanVar()
         deep_check = ttk.Checkbutton(controls_frame, text="Deep Scraping (UPC, Category, Description)",
                                     variable=self.deep_var)
-        deep_check.grid(row=2, column=0, columnspan=2, sticky='w', pady=10)
-        
+        deep_check.grid(row=3, column=0, columnspan=2, sticky='w', pady=10)
+
         # Log Level
-        ttk.Label(controls_frame, text="Log Level:", 
-                 font=('SF Pro Display', 10, 'bold')).grid(row=3, column=0, sticky='w', pady=5)
+        ttk.Label(controls_frame, text="Log Level:",
+                 font=('SF Pro Display', 10, 'bold')).grid(row=4, column=0, sticky='w', pady=5)
         self.log_level_var = tk.StringVar(value="INFO")
         log_level_combo = ttk.Combobox(controls_frame, textvariable=self.log_level_var,
-                                      values=["DEBUG", "INFO", "WARNING", "ERROR"], 
+                                      values=["DEBUG", "INFO", "WARNING", "ERROR"],
                                       state="readonly", width=8)
-        log_level_combo.grid(row=3, column=1, sticky='w', padx=(10, 0), pady=5)
-        
+        log_level_combo.grid(row=4, column=1, sticky='w', padx=(10, 0), pady=5)
+
         # Output Options
-        ttk.Label(controls_frame, text="Output Options:", 
-                 font=('SF Pro Display', 10, 'bold')).grid(row=4, column=0, columnspan=2, sticky='w', pady=(15, 5))
-        
+        ttk.Label(controls_frame, text="Output Options:",
+                 font=('SF Pro Display', 10, 'bold')).grid(row=5, column=0, columnspan=2, sticky='w', pady=(15, 5))
+
         # CSV Output
         csv_frame = ttk.Frame(controls_frame)
-        csv_frame.grid(row=5, column=0, columnspan=2, sticky='ew', pady=2)
+        csv_frame.grid(row=6, column=0, columnspan=2, sticky='ew', pady=2)
         csv_frame.grid_columnconfigure(1, weight=1)
         
         self.csv_var = tk.BooleanVar(value=True)
@@ -202,7 +325,7 @@ class ScraperGUI:
         
         # SQLite Output
         sqlite_frame = ttk.Frame(controls_frame)
-        sqlite_frame.grid(row=6, column=0, columnspan=2, sticky='ew', pady=2)
+        sqlite_frame.grid(row=7, column=0, columnspan=2, sticky='ew', pady=2)
         sqlite_frame.grid_columnconfigure(1, weight=1)
         
         self.sqlite_var = tk.BooleanVar()
@@ -219,7 +342,7 @@ class ScraperGUI:
         
         # Control Buttons
         button_frame = ttk.Frame(controls_frame)
-        button_frame.grid(row=7, column=0, columnspan=2, pady=(20, 0))
+        button_frame.grid(row=8, column=0, columnspan=2, pady=(20, 0))
         
         self.start_btn = ttk.Button(button_frame, text="Start Scraping", 
                                    style='Pastel.TButton', command=self.start_scraping)
@@ -234,16 +357,24 @@ class ScraperGUI:
         self.progress_var = tk.DoubleVar()
         self.progress_bar = ttk.Progressbar(controls_frame, variable=self.progress_var,
                                            maximum=100, length=200)
-        self.progress_bar.grid(row=8, column=0, columnspan=2, sticky='ew', pady=(15, 0))
-        
+        self.progress_bar.grid(row=9, column=0, columnspan=2, sticky='ew', pady=(15, 0))
+
+        # Settle the layout once, then let the frame size itself normally
+        controls_frame.update_idletasks()
+        controls_frame.grid_propagate(True)
+
     def create_output_panel(self, parent):
         """Create the output panel."""
-        output_frame = ttk.LabelFrame(parent, text="Output & Logs", 
+        output_frame = ttk.LabelFrame(parent, text="Output & Logs",
                                      style='Card.TFrame', padding=15)
         output_frame.grid(row=0, column=1, sticky='nsew')
         output_frame.grid_rowconfigure(1, weight=1)
         output_frame.grid_columnconfigure(0, weight=1)
-        
+
+        # Freeze geometry during construction, as in the controls panel
+        output_frame.grid_propagate(False)
+        output_frame.configure(width=380, height=520)
+
         # Output buttons
         button_frame = ttk.Frame(output_frame)
         button_frame.grid(row=0, column=0, sticky='ew', pady=(0, 10))
@@ -267,13 +398,18 @@ class ScraperGUI:
                                                  font=('SF Mono', 9), wrap=tk.WORD)
         self.log_text.grid(row=1, column=0, sticky='nsew')
         
-        # Configure text tags for colored output
-        self.log_text.tag_configure("INFO", foreground=self.colors['text_primary'])
-        self.log_text.tag_configure("DEBUG", foreground=self.colors['text_secondary'])
-        self.log_text.tag_configure("WARNING", foreground=self.colors['warning'])
-        self.log_text.tag_configure("ERROR", foreground=self.colors['error'])
-        self.log_text.tag_configure("SUCCESS", foreground=self.colors['success'])
-        
+        # Configure text tags for colored output (colors bound locally, as in setup_styles)
+        colors = self.colors
+        tag_configure = self.log_text.tag_configure
+        tag_configure("INFO", foreground=colors['text_primary'])
+        tag_configure("DEBUG", foreground=colors['text_secondary'])
+        tag_configure("WARNING", foreground=colors['warning'])
+        tag_configure("ERROR", foreground=colors['error'])
+        tag_configure("SUCCESS", foreground=colors['success'])
+
+        output_frame.update_idletasks()
+        output_frame.grid_propagate(True)
+
     def create_footer(self, parent):
         """Create the footer section."""
         footer_frame = ttk.Frame(parent, style='Card.TFrame')
@@ -318,37 +454,83 @@ class ScraperGUI:
             self.sqlite_filename_var.set(filename)
             
     def log_message(self, message, level="INFO"):
-        """Add a message to the log output."""
-        self.log_text.insert(tk.END, f"{message}\n", level)
-        self.log_text.see(tk.END)
-        self.root.update_idletasks()
-        
+        """Queue a message for the log output (safe to call from any thread)."""
+        if _LOG_LEVELS.get(level, 20) < self._min_level:
+            return
+        self._log_queue.put((level, message))
+
+    def _drain_log(self):
+        """Drain queued log messages into the Text widget in one batch."""
+        runs = []  # consecutive messages sharing a tag, in arrival order
+        while True:
+            try:
+                level, message = self._log_queue.get_nowait()
+            except queue.Empty:
+                break
+            if runs and runs[-1][0] == level:
+                runs[-1][1].append(message)
+            else:
+                runs.append((level, [message]))
+
+        if runs:
+            # Don't yank the view down if the user has scrolled up to read
+            at_bottom = self.log_text.yview()[1] >= 0.999
+            for level, messages in runs:
+                self.log_text.insert(tk.END, "\n".join(messages) + "\n", level)
+
+            # Trim oldest lines so memory and redraw cost stay bounded
+            lines = int(self.log_text.index('end-1c').split('.')[0])
+            if lines > _MAX_LOG_LINES:
+                self.log_text.delete('1.0', f'{lines - _MAX_LOG_LINES}.0')
+
+            if at_bottom:
+                self.log_text.see(tk.END)
+
+        # Apply only the latest progress/status values from the workers
+        with self._ui_lock:
+            progress, self._progress = self._progress, None
+            delta, self._pending_progress = self._pending_progress, 0.0
+            status, self._status = self._status, None
+        if progress is not None:
+            self.progress_var.set(progress)
+        if delta:
+            self.progress_bar.step(delta)
+        if status is not None:
+            self.status_var.set(status)
+
+        self.root.after(50, self._drain_log)
+
     def clear_log(self):
         """Clear the log output."""
         self.log_text.delete(1.0, tk.END)
         
     def update_progress(self, value):
-        """Update the progress bar."""
-        self.progress_var.set(value)
-        self.root.update_idletasks()
-        
+        """Record the latest progress value (applied on the next drain tick)."""
+        with self._ui_lock:
+            self._progress = value
+            self._pending_progress = 0.0
+
+    def add_progress(self, delta):
+        """Accumulate a progress increment (stepped on the next drain tick)."""
+        with self._ui_lock:
+            self._pending_progress += delta
+
     def update_status(self, message):
-        """Update the status message."""
-        self.status_var.set(message)
-        self.root.update_idletasks()
-        
+        """Record the latest status message (applied on the next drain tick)."""
+        with self._ui_lock:
+            self._status = message
+
     def start_scraping(self):
-        """Start the scraping process in a separate thread."""
+        """Start the scraping process on the background event loop."""
         if self.is_running:
             return
             
-        # Validate inputs
-        try:
-            max_pages = int(self.max_pages_var.get())
-            delay = float(self.delay_var.get())
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter valid numbers for pages and delay.")
-            return
+        # Key validators keep these fields numeric, so the casts cannot raise;
+        # an emptied field falls back to its default and out-of-range values
+        # are clamped (a zero concurrency would deadlock the semaphore)
+        max_pages = max(1, int(self.max_pages_var.get() or 3))
+        delay = max(0.0, float(self.delay_var.get().rstrip('.') or 0.7))
+        concurrency = max(1, int(self.concurrency_var.get() or 4))
             
         if not self.csv_var.get() and not self.sqlite_var.get():
             messagebox.showerror("No Output", "Please select at least one output format.")
@@ -360,81 +542,105 @@ class ScraperGUI:
         self.stop_btn.config(state='normal')
         self.update_status("Scraping in progress...")
         self.update_progress(0)
-        
-        # Start scraping in separate thread
-        thread = threading.Thread(target=self.run_scraping, 
-                                 args=(max_pages, delay), daemon=True)
-        thread.start()
-        
-    def run_scraping(self, max_pages, delay):
-        """Run the actual scraping process."""
+        # Fresh event per scrape: clearing the shared one would un-cancel a
+        # previous scrape that is still winding down
+        self._stop_event = threading.Event()
+        
+        # Resolve the level string to an int once; everything downstream
+        # compares integers per log call
+        log_level = self.log_level_var.get()
+        self._min_level = _LOG_LEVELS[log_level]
+        self._gui_logger.level = self._min_level
+
+        # Initialize scraper and route its log output to the GUI queue
+        self.log_message("Initializing scraper...", "INFO")
+        self.scraper = BooksToScrapeScraper(delay=delay, log_level=log_level)
+        self.scraper.logger = self._gui_logger
+
+        # Submit the async scrape to the persistent event loop
+        self.log_message(f"Starting to scrape {max_pages} pages...", "INFO")
+        future = asyncio.run_coroutine_threadsafe(
+            self.scraper.scrape_books_async(max_pages=max_pages,
+                                            deep=self.deep_var.get(),
+                                            concurrency=concurrency,
+                                            stop_event=self._stop_event),
+            self._loop
+        )
+        future.add_done_callback(self._on_scrape_done)
+
+    def _on_tk_thread(self, func, *args):
+        """Marshal a widget mutation onto the Tk main loop.
+
+        Runs on the event-loop thread; Tk widgets must only be touched
+        from the thread that created them.
+        """
+        self.root.after(0, func, *args)
+
+    def _on_scrape_done(self, future):
+        """Save results and finish up once the scrape coroutine completes."""
         try:
-            # Initialize scraper
-            self.log_message("Initializing scraper...", "INFO")
-            self.scraper = BooksToScrapeScraper(delay=delay, log_level=self.log_level_var.get())
-            
-            # Override the scraper's logger to use our GUI
-            original_logger = self.scraper.logger
-            self.scraper.logger = type('GUILogger', (), {
-                'info': lambda msg: self.log_message(f"INFO: {msg}", "INFO"),
-                'warning': lambda msg: self.log_message(f"WARNING: {msg}", "WARNING"),
-                'error': lambda msg: self.log_message(f"ERROR: {msg}", "ERROR"),
-                'debug': lambda msg: self.log_message(f"DEBUG: {msg}", "DEBUG")
-            })()
-            
-            # Scrape books
-            self.log_message(f"Starting to scrape {max_pages} pages...", "INFO")
-            books = self.scraper.scrape_books(max_pages=max_pages, deep=self.deep_var.get())
-            
+            books = future.result()
+
             if not books:
                 self.log_message("No books were scraped!", "ERROR")
                 return
-                
+
             # Update progress
             self.update_progress(50)
-            
+
             # Save to files
             if self.csv_var.get():
                 csv_file = self.csv_filename_var.get()
                 self.log_message(f"Saving to CSV: {csv_file}", "INFO")
                 self.scraper.save_to_csv(books, csv_file)
-                self.open_csv_btn.config(state='normal')
+                self._on_tk_thread(lambda: self.open_csv_btn.config(state='normal'))
                 
             if self.sqlite_var.get():
                 sqlite_file = self.sqlite_filename_var.get()
                 self.log_message(f"Saving to SQLite: {sqlite_file}", "INFO")
                 self.scraper.save_to_sqlite(books, sqlite_file)
-                self.open_sqlite_btn.config(state='normal')
-                
+                self._on_tk_thread(lambda: self.open_sqlite_btn.config(state='normal'))
+
             # Update progress
             self.update_progress(100)
-            
+
             # Show completion message
             self.log_message(f"Scraping completed successfully!", "SUCCESS")
             self.log_message(f"Total books scraped: {len(books)}", "SUCCESS")
             self.update_status(f"Completed! Scraped {len(books)} books")
             
-            # Show sample data
-            self.log_message("\n" + "="*50, "INFO")
-            self.log_message("SAMPLE DATA - First 5 books:", "INFO")
-            self.log_message("="*50, "INFO")
-            
-            for i, book in enumerate(books[:5]):
-                self.log_message(f"{i+1}. {book.title[:50]}... | {book.price} | Rating: {book.rating}", "INFO")
+            # Show sample data as one log event (skip entirely if filtered)
+            if self._min_level <= _LOG_LEVELS["INFO"]:
+                preview = "\n".join([
+                    "\n" + "="*50,
+                    "SAMPLE DATA - First 5 books:",
+                    "="*50,
+                    *[f"{i+1}. {book.title[:50]}... | {book.price} | Rating: {book.rating}"
+                      for i, book in enumerate(books[:5])]
+                ])
+                self.log_message(preview, "INFO")
                 
         except Exception as e:
             self.log_message(f"Error during scraping: {str(e)}", "ERROR")
             self.update_status("Scraping failed!")
             
         finally:
-            # Reset UI state
+            # Reset UI state on the Tk thread
             self.is_running = False
-            self.start_btn.config(state='normal')
-            self.stop_btn.config(state='disabled')
-            self.update_progress(0)
+            self._on_tk_thread(self._reset_after_scrape)
+
+    def _reset_after_scrape(self):
+        """Restore the idle button state (runs on the Tk main loop)."""
+        self.start_btn.config(state='normal')
+        self.stop_btn.config(state='disabled')
+        # Leave the completion state visible for a moment; an immediate
+        # reset would land in the same drain tick and the bar would
+        # never show it
+        self.root.after(1500, self.update_progress, 0)
             
     def stop_scraping(self):
         """Stop the scraping process."""
+        self._stop_event.set()
         self.is_running = False
         self.log_message("Scraping stopped by user", "WARNING")
         self.update_status("Scraping stopped")
@@ -445,7 +651,7 @@ class ScraperGUI:
         """Open the CSV file in the default application."""
         csv_file = self.csv_filename_var.get()
         if os.path.exists(csv_file):
-            os.system(f"open '{csv_file}'")
+            _open_path(csv_file)
         else:
             messagebox.showerror("File Not Found", f"CSV file not found: {csv_file}")
             
@@ -453,7 +659,7 @@ class ScraperGUI:
         """Open the SQLite file location."""
         sqlite_file = self.sqlite_filename_var.get()
         if os.path.exists(sqlite_file):
-            os.system(f"open '{os.path.dirname(sqlite_file)}'")
+            _open_path(os.path.dirname(sqlite_file) or ".")
         else:
             messagebox.showerror("File Not Found", f"SQLite file not found: {sqlite_file}")
 